@@ -1,6 +1,7 @@
 """Typer application entrypoint with global options."""
 
 import logging
+import sys
 from typing import Annotated
 
 import structlog
@@ -12,7 +13,23 @@ from .scan import scan_command
 from .sync import sync_command
 
 
-def _configure_structlog() -> None:
+class _Stderr:
+    """Write to whatever sys.stderr is at call time.
+
+    Loggers are cached on first use, so binding the stream object at
+    configure time would pin them to a stream that may since be replaced.
+    """
+
+    def write(self, text: str) -> int:
+        return sys.stderr.write(text)
+
+    def flush(self) -> None:
+        sys.stderr.flush()
+
+
+def _configure_structlog(level: int = logging.WARNING) -> None:
+    # stderr keeps logs out of json/jsonl stdout and off the live view; below
+    # the level, log calls are no-ops and never reach the renderer.
     structlog.configure(
         processors=[
             structlog.contextvars.merge_contextvars,
@@ -20,7 +37,8 @@ def _configure_structlog() -> None:
             structlog.processors.TimeStamper(fmt="iso"),
             structlog.dev.ConsoleRenderer(colors=True),
         ],
-        wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
+        wrapper_class=structlog.make_filtering_bound_logger(level),
+        logger_factory=structlog.PrintLoggerFactory(_Stderr()),
         cache_logger_on_first_use=True,
     )
 
@@ -47,6 +65,15 @@ def main(
     """Global options for py-local-git-pull."""
     if verbose and quiet:
         raise typer.Exit(code=2)
+    if quiet:
+        level = logging.ERROR
+    elif verbose >= 2:
+        level = logging.DEBUG
+    elif verbose == 1:
+        level = logging.INFO
+    else:
+        level = logging.WARNING
+    _configure_structlog(level)
 
 
 app.command("scan")(scan_command)
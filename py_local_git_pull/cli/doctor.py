@@ -10,7 +10,6 @@ import typer
 from py_local_git_pull.core.services.inspector import RepoInspector
 from py_local_git_pull.runtime.doctor import diagnose_from_inspections, load_diagnosis
 from py_local_git_pull.state.paths import get_state_paths
-from py_local_git_pull.ui.doctor_view import render_doctor_result
 
 
 def doctor_command(
@@ -48,6 +47,7 @@ def doctor_command(
         raise typer.Exit(code=0)
 
     from py_local_git_pull.ui.console import make_console
+    from py_local_git_pull.ui.doctor_view import render_doctor_result
 
     console = make_console()
     if not results:
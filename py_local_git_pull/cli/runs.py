@@ -4,14 +4,15 @@ import typer
 
 from py_local_git_pull.runtime.journal import list_runs, load_run
 from py_local_git_pull.state.paths import get_state_paths
-from py_local_git_pull.ui.console import make_console
-from py_local_git_pull.ui.runs_view import render_run_detail, render_runs_list
 
 app = typer.Typer(help="Inspect persisted sync runs.")
 
 
 @app.command("list")
 def list_runs_command() -> None:
+    from py_local_git_pull.ui.console import make_console
+    from py_local_git_pull.ui.runs_view import render_runs_list
+
     paths = get_state_paths()
     console = make_console()
     render_runs_list(console, list_runs(paths.runs_dir))
@@ -19,6 +20,9 @@ def list_runs_command() -> None:
 
 @app.command("show")
 def show_run_command(run_id: str) -> None:
+    from py_local_git_pull.ui.console import make_console
+    from py_local_git_pull.ui.runs_view import render_run_detail
+
     paths = get_state_paths()
     console = make_console()
     run = load_run(paths.runs_dir, run_id)
@@ -1,21 +1,45 @@
 """Scan command for repository inspection."""
 
+from collections import Counter
 import json
-from dataclasses import asdict
 from pathlib import Path
 from typing import Annotated
 
 import typer
 
-from py_local_git_pull.core.models import RiskLevel
+from py_local_git_pull.core.models import RepoInspection, RiskLevel
 from py_local_git_pull.core.services.inspector import RepoInspector
-from py_local_git_pull.ui.scan_view import render_scan_summary
+from py_local_git_pull.runtime.journal import json_default
+
+
+def _build_summary(inspections: tuple[RepoInspection, ...]) -> dict[str, object]:
+    """Count risk levels in one pass for the JSON summary."""
+    levels = Counter(item.risk_level for item in inspections)
+    counts = {
+        "low": levels[RiskLevel.LOW],
+        "medium": levels[RiskLevel.MEDIUM],
+        "high": levels[RiskLevel.HIGH],
+    }
+    return {
+        "total": len(inspections),
+        "clean": counts["low"],
+        "attention": counts["medium"],
+        "blocked": counts["high"],
+        "risk_counts": counts,
+    }
 
 
 def scan_command(
     path: Path,
     recursive: Annotated[bool, typer.Option("--recursive", "-r")] = False,
     max_depth: Annotated[int, typer.Option("--max-depth")] = 3,
+    no_prune: Annotated[
+        bool,
+        typer.Option(
+            "--no-prune",
+            help="Also descend into build, dist, target, vendor and site-packages dirs",
+        ),
+    ] = False,
     output: Annotated[str, typer.Option("--output")] = "table",
 ) -> None:
     """Scan a path for git repositories and show their status."""
@@ -23,36 +47,23 @@ def scan_command(
         str(path),
         recursive=recursive,
         max_depth=max_depth,
+        prune=not no_prune,
     )
 
     if output == "json":
-        counts = {
-            "low": sum(1 for item in inspections if item.risk_level is RiskLevel.LOW),
-            "medium": sum(1 for item in inspections if item.risk_level is RiskLevel.MEDIUM),
-            "high": sum(1 for item in inspections if item.risk_level is RiskLevel.HIGH),
-        }
+        summary = _build_summary(inspections)
         payload = {
             "schema_version": 3,
             "command": "scan",
             "path": str(path),
-            "summary": {
-                "total": len(inspections),
-                "clean": counts["low"],
-                "attention": counts["medium"],
-                "blocked": counts["high"],
-                "risk_counts": counts,
-            },
-            "repos": [asdict(inspection) for inspection in inspections],
+            "summary": summary,
+            "repos": inspections,
         }
-        print(json.dumps(payload, ensure_ascii=False, default=list))
+        print(json.dumps(payload, ensure_ascii=False, default=json_default))
         raise typer.Exit(code=0)
 
     if output == "jsonl":
-        counts = {
-            "low": sum(1 for item in inspections if item.risk_level is RiskLevel.LOW),
-            "medium": sum(1 for item in inspections if item.risk_level is RiskLevel.MEDIUM),
-            "high": sum(1 for item in inspections if item.risk_level is RiskLevel.HIGH),
-        }
+        summary = _build_summary(inspections)
         for inspection in inspections:
             print(
                 json.dumps(
@@ -61,10 +72,10 @@ def scan_command(
                         "command": "scan",
                         "event": "repo_scanned",
                         "path": str(path),
-                        "repo": asdict(inspection),
+                        "repo": inspection,
                     },
                     ensure_ascii=False,
-                    default=list,
+                    default=json_default,
                 )
             )
         print(
@@ -74,21 +85,16 @@ def scan_command(
                     "command": "scan",
                     "event": "scan_summary",
                     "path": str(path),
-                    "summary": {
-                        "total": len(inspections),
-                        "clean": counts["low"],
-                        "attention": counts["medium"],
-                        "blocked": counts["high"],
-                        "risk_counts": counts,
-                    },
+                    "summary": summary,
                 },
                 ensure_ascii=False,
-                default=list,
+                default=json_default,
             )
         )
         raise typer.Exit(code=0)
 
     from py_local_git_pull.ui.console import make_console
+    from py_local_git_pull.ui.scan_view import render_scan_summary
 
     console = make_console()
     render_scan_summary(
@@ -1,12 +1,12 @@
 """Sync command with event-driven execution and journal persistence."""
 
 import json
-from dataclasses import asdict, replace
+from dataclasses import replace
 from datetime import UTC, datetime
 from functools import partial
 from pathlib import Path
 from time import perf_counter
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import anyio
 import typer
@@ -21,18 +21,13 @@ from py_local_git_pull.core.models import PolicyMode, RepoOutcome, RepoStatus, R
 from py_local_git_pull.core.services.inspector import RepoInspector
 from py_local_git_pull.core.services.sync_service import SyncService, build_sync_plan
 from py_local_git_pull.runtime.executor import execute_sync_run, summarize_outcomes
-from py_local_git_pull.runtime.journal import write_run_record
+from py_local_git_pull.runtime.journal import json_default, write_run_record
 from py_local_git_pull.state.paths import get_state_paths
 from py_local_git_pull.ui.console import make_console
 from py_local_git_pull.ui.interactive import choose_repo_paths
-from py_local_git_pull.ui.live import LiveSyncRenderer
-from py_local_git_pull.ui.sync_view import (
-    render_next_actions,
-    render_plan_panel,
-    render_profile_panel,
-    render_summary_panel,
-    render_sync_header,
-)
+
+if TYPE_CHECKING:
+    from py_local_git_pull.ui.live import LiveSyncRenderer
 
 
 def build_sync_service(repo_path: str) -> SyncService:
@@ -117,6 +112,13 @@ def sync_command(
     ] = None,
     recursive: Annotated[bool, typer.Option("--recursive", "-r")] = False,
     max_depth: Annotated[int, typer.Option("--max-depth")] = DEFAULT_MAX_DEPTH,
+    no_prune: Annotated[
+        bool,
+        typer.Option(
+            "--no-prune",
+            help="Also descend into build, dist, target, vendor and site-packages dirs",
+        ),
+    ] = False,
     auto_upstream: Annotated[bool, typer.Option("--auto-upstream")] = False,
     skip_non_exist: Annotated[bool, typer.Option("--skip-non-exist/--no-skip-non-exist")] = True,
     no_stash: Annotated[bool, typer.Option("--no-stash")] = False,
@@ -156,6 +158,7 @@ def sync_command(
         recursive=recursive,
         max_depth=max_depth,
         include_branch_deltas=not interactive,
+        prune=not no_prune,
     )
     timings["lightweight_inspect" if interactive else "inspect"] = (
         perf_counter() - inspect_started
@@ -169,13 +172,7 @@ def sync_command(
             console.print("[yellow]No repos selected, exiting.[/]")
             raise typer.Exit(code=0)
         full_inspect_started = perf_counter()
-        inspections = tuple(
-            inspector.inspect_repo(
-                selected_path,
-                include_branch_deltas=True,
-            )
-            for selected_path in selected_paths
-        )
+        inspections = inspector.inspect_repos(selected_paths, include_branch_deltas=True)
         timings["full_inspect"] = perf_counter() - full_inspect_started
 
     try:
@@ -185,7 +182,7 @@ def sync_command(
         async def emit(event):
             event_log.append(event)
             if output == "jsonl":
-                print(json.dumps(asdict(event), ensure_ascii=False))
+                print(json.dumps(event, ensure_ascii=False, default=json_default))
             elif renderer is not None:
                 renderer.push(event)
 
@@ -205,6 +202,8 @@ def sync_command(
             )
 
         if output == "table":
+            from py_local_git_pull.ui.live import LiveSyncRenderer
+
             with LiveSyncRenderer(console) as live_renderer:
                 renderer = live_renderer
                 execution_started = perf_counter()
@@ -222,15 +221,23 @@ def sync_command(
             payload = {
                 "schema_version": 3,
                 "command": "sync",
-                "run": asdict(run_record),
-                "repos": [asdict(o) for o in run_record.outcomes],
+                "run": run_record,
+                "repos": run_record.outcomes,
             }
             if profile_inspect:
                 payload["timings"] = timings
-            print(json.dumps(payload, ensure_ascii=False, default=list))
+            print(json.dumps(payload, ensure_ascii=False, default=json_default))
             raise typer.Exit(code=0)
 
         if output == "table":
+            from py_local_git_pull.ui.sync_view import (
+                render_next_actions,
+                render_plan_panel,
+                render_profile_panel,
+                render_summary_panel,
+                render_sync_header,
+            )
+
             render_sync_header(console, str(path), inspections, branches, dry_run)
             if profile_inspect:
                 render_profile_panel(console, timings)
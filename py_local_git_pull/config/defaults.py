@@ -3,6 +3,9 @@
 # Git operation defaults
 DEFAULT_REMOTE: str = "origin"
 BARE_REPO_VALUE: str = "true"
+# rev-parse --is-bare-repository / --is-shallow-repository answers, as run_bytes returns them
+BARE_REPO_BYTES: bytes = BARE_REPO_VALUE.encode()
+SHALLOW_REPO_BYTES: bytes = b"true"
 HEAD_REF: str = "HEAD"
 DEFAULT_TIMEOUT_SECONDS: int = 60
 
@@ -15,6 +18,7 @@ DEFAULT_NO_STASH: bool = False
 DEFAULT_WORKERS: int = 4
 
 # Discovery defaults
+DEFAULT_SCAN_WORKERS: int = 8
 SKIP_DIR_NAMES: frozenset[str] = frozenset(
     {
         ".git",
@@ -24,3 +28,13 @@ SKIP_DIR_NAMES: frozenset[str] = frozenset(
         "node_modules",
     }
 )
+# Build/dependency output: checked for a repo of the same name, never descended.
+PRUNE_DIR_NAMES: frozenset[str] = frozenset(
+    {
+        "site-packages",
+        "target",
+        "build",
+        "dist",
+        "vendor",
+    }
+)
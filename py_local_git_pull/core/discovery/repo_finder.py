@@ -1,57 +1,117 @@
-"""Repository discovery via BFS directory scanning."""
+"""Repository discovery via parallel BFS directory scanning."""
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import os
-from collections import deque
 from pathlib import Path
+import stat
 import subprocess
 
 import structlog
 
-from py_local_git_pull.config.defaults import SKIP_DIR_NAMES
+from py_local_git_pull.config.defaults import (
+    BARE_REPO_BYTES,
+    DEFAULT_SCAN_WORKERS,
+    PRUNE_DIR_NAMES,
+    SKIP_DIR_NAMES,
+)
+from py_local_git_pull.core.git.runner import git_executable
 
 log = structlog.get_logger()
 
 
-def looks_like_git_repo_candidate(path: Path) -> bool:
-    """Fast filesystem check before running git commands."""
-    git_dir = path / ".git"
-    if git_dir.exists():
-        return True
+def _has_bare_repo_layout(path: str) -> bool:
+    """Check for the HEAD/objects/refs layout of a bare repository."""
+    return (
+        os.path.isfile(os.path.join(path, "HEAD"))
+        and os.path.isdir(os.path.join(path, "objects"))
+        and os.path.isdir(os.path.join(path, "refs"))
+    )
+
 
+def _read_core_bare(path: str) -> bool | None:
+    """Read core.bare from the repository config file.
+
+    Only the plain ``bare = true|false`` form that ``git init`` writes is
+    recognised; anything else returns None so the caller can ask git.
+    """
     try:
-        return (
-            path.joinpath("HEAD").is_file()
-            and path.joinpath("objects").is_dir()
-            and path.joinpath("refs").is_dir()
-        )
-    except (OSError, PermissionError):
-        return False
+        with open(os.path.join(path, "config"), encoding="utf-8", errors="replace") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return None
+
+    in_core = False
+    for raw in lines:
+        line = raw.strip()
+        if line.startswith("["):
+            in_core = line.lower() == "[core]"
+            continue
+        if not in_core:
+            continue
+        key, sep, value = line.partition("=")
+        if sep and key.strip().lower() == "bare":
+            value = value.strip().lower()
+            if value in ("true", "false"):
+                return value == "true"
+            return None
+    return None
 
 
-def is_git_repo(path: str) -> bool:
-    """Check if path is a git repository root."""
-    target = Path(path)
-    if not target.exists() or not target.is_dir():
-        return False
+def _is_bare_repository(path: str) -> bool:
+    """Check whether path is a bare repository, spawning git only if the config is unclear."""
+    core_bare = _read_core_bare(path)
+    if core_bare is not None:
+        return core_bare
 
     try:
         result = subprocess.run(
-            ["git", "-C", str(target), "rev-parse", "--show-toplevel"],
+            [git_executable(), "-C", path, "rev-parse", "--is-bare-repository"],
             capture_output=True,
-            text=True,
             check=False,
         )
-        if result.returncode != 0:
-            return False
-
-        repo_root = Path(result.stdout.strip())
-        return repo_root.resolve() == target.resolve()
+        return result.returncode == 0 and result.stdout.strip() == BARE_REPO_BYTES
     except subprocess.SubprocessError as e:
         log.debug("git_check_failed", path=path, error=str(e))
         return False
 
 
-def _should_skip_directory(entry: os.DirEntry, visited: set[Path]) -> bool:
+def _gitfile_target_exists(gitfile: str, repo_path: str) -> bool:
+    """Check that a ``.git`` file is a ``gitdir:`` link to an existing directory."""
+    try:
+        with open(gitfile, encoding="utf-8", errors="replace") as f:
+            line = f.readline()
+    except OSError:
+        return False
+
+    prefix, sep, target = line.partition(":")
+    if not sep or prefix != "gitdir":
+        return False
+    target = target.strip()
+    return bool(target) and os.path.isdir(os.path.join(repo_path, target))
+
+
+def is_git_repo(path: str) -> bool:
+    """Check if path is a git repository root.
+
+    A ``.git`` directory, or a ``.git`` file (worktrees and submodules) whose
+    ``gitdir:`` target exists, answers this from the filesystem. A bare
+    repository layout is confirmed from its config file, and git is only
+    spawned when that is inconclusive. A path that is not a directory fails
+    every probe, so no separate directory check is made.
+    """
+    dot_git = os.path.join(path, ".git")
+    try:
+        mode = os.stat(dot_git).st_mode
+    except OSError:
+        return _has_bare_repo_layout(path) and _is_bare_repository(path)
+
+    if stat.S_ISDIR(mode):
+        return True
+    return stat.S_ISREG(mode) and _gitfile_target_exists(dot_git, path)
+
+
+def _should_skip_directory(entry: os.DirEntry) -> bool:
     """Check if directory should be skipped during scan."""
     if not entry.is_dir(follow_symlinks=False):
         return True
@@ -59,63 +119,86 @@ def _should_skip_directory(entry: os.DirEntry, visited: set[Path]) -> bool:
         return True
     if entry.name.startswith("."):
         return True
-    sub_path = Path(entry.path)
-    if sub_path in visited:
-        return True
     return False
 
 
-def _try_add_git_repo(path: Path, repos: set[str]) -> bool:
-    """Try to add a git repository to the set. Returns True if successful."""
-    if looks_like_git_repo_candidate(path) and is_git_repo(str(path)):
-        repos.add(str(path.resolve()))
-        return True
-    return False
+def _scan_directory(current: str, prune: bool = True) -> tuple[list[str], list[str]]:
+    """Scan one directory level.
 
+    With prune set, build/dependency output dirs (PRUNE_DIR_NAMES) are still
+    checked for a repository but never descended into.
 
-def find_git_repos(base_path: str, max_depth: int = 3) -> list[str]:
-    """Find all git repositories under base_path up to max_depth."""
+    Returns:
+        (repo_paths, subdirectories_to_descend)
+    """
+    repos: list[str] = []
+    subdirs: list[str] = []
+    try:
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if _should_skip_directory(entry):
+                    continue
+
+                if is_git_repo(entry.path):
+                    repos.append(entry.path)
+                    continue
+
+                if prune and entry.name in PRUNE_DIR_NAMES:
+                    log.debug("dir_pruned", path=entry.path)
+                    continue
+                subdirs.append(entry.path)
+    except (PermissionError, FileNotFoundError, NotADirectoryError) as e:
+        log.warning("dir_access_error", path=current, error=str(e))
+    except Exception as e:
+        log.error("scan_error", path=current, error=str(e))
+    return repos, subdirs
+
+
+def find_git_repos(
+    base_path: str,
+    max_depth: int = 3,
+    workers: int = DEFAULT_SCAN_WORKERS,
+    *,
+    prune: bool = True,
+) -> list[str]:
+    """Find all git repositories under base_path up to max_depth.
+
+    Each BFS level is scanned on a thread pool; scandir and the occasional
+    git probe release the GIL, so sibling subtrees are walked concurrently.
+    """
     repos: set[str] = set()
     root = Path(base_path).expanduser()
     log.debug("scan_start", path=str(root), max_depth=max_depth)
 
-    if not root.exists():
+    try:
+        root_mode = root.stat().st_mode
+    except OSError:
         log.warning("path_missing", path=str(root))
         return []
 
-    if root.is_file():
+    if stat.S_ISREG(root_mode):
         parent_dir = root.parent
         return [str(parent_dir.resolve())] if is_git_repo(str(parent_dir)) else []
 
     if is_git_repo(str(root)):
         return [str(root.resolve())]
 
-    queue: deque[tuple[Path, int]] = deque([(root, 0)])
-    visited: set[Path] = set()
-
-    while queue:
-        current, depth = queue.popleft()
-        if current in visited:
-            continue
-        visited.add(current)
-
-        if depth > max_depth:
-            continue
-
-        try:
-            with os.scandir(current) as entries:
-                for entry in entries:
-                    if _should_skip_directory(entry, visited):
-                        continue
-
-                    sub_path = Path(entry.path)
-                    if _try_add_git_repo(sub_path, repos):
-                        continue
-
-                    queue.append((sub_path, depth + 1))
-        except (PermissionError, FileNotFoundError, NotADirectoryError) as e:
-            log.warning("dir_access_error", path=str(current), error=str(e))
-        except Exception as e:
-            log.error("scan_error", path=str(current), error=str(e))
+    # Symlinks are never followed and each level only holds children of the
+    # previous one, so a directory cannot be reached twice; no visited set.
+    # For the same reason every path below a resolved root is already
+    # resolved, so the walk works on plain DirEntry.path strings.
+    level: list[str] = [os.path.realpath(root)]
+    depth = 0
+
+    scan = partial(_scan_directory, prune=prune)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        while level and depth <= max_depth:
+            next_level: list[str] = []
+            for found, subdirs in pool.map(scan, level):
+                repos.update(found)
+                next_level.extend(subdirs)
+
+            level = next_level
+            depth += 1
 
     return sorted(repos)
@@ -1,18 +1,20 @@
 """Branch operations: checkout, upstream, existence checks."""
 
+import re
+
 from py_local_git_pull.core.git.runner import GitRunner
 from py_local_git_pull.config.defaults import DEFAULT_REMOTE
 
+_TRACK_COUNT_RE = re.compile(r"(ahead|behind) (\d+)")
+_HEADS_PREFIX = "refs/heads/"
+
 
 class BranchOperations:
     """Operations on git branches."""
 
     def __init__(self, runner: GitRunner):
         self._runner = runner
-
-    def _run_check(self, cmd: list[str]) -> bool:
-        code, out, _ = self._runner.run(cmd, check=False)
-        return code == 0 and bool(out)
+        self._local_branches: set[str] | None = None
 
     def get_current_branch(self) -> str | None:
         """Get the current branch name, or None if detached HEAD."""
@@ -23,30 +25,55 @@ class BranchOperations:
 
     def branch_exists_locally(self, branch: str) -> bool:
         """Check if branch exists locally."""
-        return self._run_check(["branch", "--list", branch])
+        return branch in self._load_local_branches()
+
+    def _load_local_branches(self) -> set[str]:
+        """List local branch names, once per instance."""
+        if self._local_branches is None:
+            self._local_branches = {
+                row[0][len(_HEADS_PREFIX) :] for row in self._list_refs((), (_HEADS_PREFIX,))
+            }
+        return self._local_branches
+
+    def _list_refs(self, fields: tuple[str, ...], patterns: tuple[str, ...]) -> list[list[str]]:
+        """List refs as rows of the full refname followed by the requested fields.
+
+        Local branch names are cut from the full refname by the callers:
+        %(refname:short) prints "heads/<name>" when a tag of the same name
+        exists. Rows are padded, since run() strips trailing blank fields.
+        """
+        fmt = "%09".join(("%(refname)", *fields))
+        code, out, _ = self._runner.run(
+            ["for-each-ref", f"--format={fmt}", *patterns], check=False
+        )
+        if code != 0 or not out:
+            return []
+
+        width = len(fields) + 1
+        return [(line.split("\t") + [""] * width)[:width] for line in out.splitlines()]
 
     def branch_exists_remotely(self, branch: str, remote_branches: set[str] | None = None) -> bool:
         """Check if branch exists on the default remote."""
         if remote_branches is not None:
             return branch in remote_branches
 
-        return self._run_check(["ls-remote", "--heads", DEFAULT_REMOTE, branch])
+        code, out, _ = self._runner.run(
+            ["ls-remote", "--heads", DEFAULT_REMOTE, branch], check=False
+        )
+        return code == 0 and bool(out)
 
     def get_remote_branches(self) -> set[str]:
         """Get all remote branch names from refs."""
+        # lstrip=3 drops "refs/remotes/<remote>/", leaving the branch name as-is.
         code, out, _ = self._runner.run(
-            ["for-each-ref", "--format=%(refname:short)", f"refs/remotes/{DEFAULT_REMOTE}"],
+            ["for-each-ref", "--format=%(refname:lstrip=3)", f"refs/remotes/{DEFAULT_REMOTE}/"],
             check=False,
         )
         if code != 0:
             return set()
 
-        prefix = f"{DEFAULT_REMOTE}/"
-        branches: set[str] = set()
-        for line in out.splitlines():
-            ref = line.strip()
-            if ref.startswith(prefix) and not ref.endswith("/HEAD"):
-                branches.add(ref[len(prefix) :])
+        branches = set(out.splitlines())
+        branches.discard("HEAD")
         return branches
 
     def checkout_branch(
@@ -67,6 +94,7 @@ class BranchOperations:
 
         if create_if_not_exist and self.branch_exists_remotely(branch, remote_branches):
             self._runner.run(["checkout", "-b", branch, f"{DEFAULT_REMOTE}/{branch}"])
+            self._local_branches = None
             return True, None
 
         return False, f"branch {branch} does not exist"
@@ -96,6 +124,51 @@ class BranchOperations:
         self._runner.run(["branch", f"--set-upstream-to={DEFAULT_REMOTE}/{branch}", branch])
         return True, f"{DEFAULT_REMOTE}/{branch}", None
 
+    def get_branch_tracking(
+        self, *, include_counts: bool = True
+    ) -> list[tuple[str, bool, str, tuple[int, int] | None]]:
+        """Get every local branch with its upstream and ahead/behind counts.
+
+        One for-each-ref call replaces a rev-parse and a rev-list per branch.
+        Remote refs are listed in the same call so that a configured upstream
+        whose ref is gone counts as no upstream, matching set_upstream.
+        %(upstream:track) makes git walk history for every branch, so it is
+        only requested when include_counts is set.
+
+        Returns:
+            List of (branch_name, is_current, upstream_name, (ahead, behind) | None)
+            tuples; upstream_name is "" when the branch has no upstream, and the
+            counts are None when include_counts is False.
+        """
+        fields = ("%(HEAD)", "%(upstream)")
+        if include_counts:
+            fields += ("%(upstream:track)",)
+        rows = self._list_refs(fields, (_HEADS_PREFIX, "refs/remotes/"))
+        existing_refs = {row[0] for row in rows}
+
+        branches = []
+        for refname, head, upstream, *track in rows:
+            if not refname.startswith(_HEADS_PREFIX):
+                continue
+            name = refname[len(_HEADS_PREFIX) :]
+            is_current = head == "*"
+            if upstream not in existing_refs:
+                branches.append((name, is_current, "", None))
+                continue
+
+            upstream_name = upstream.split("/", 2)[-1]
+            if not include_counts:
+                branches.append((name, is_current, upstream_name, None))
+                continue
+
+            counts = dict.fromkeys(("ahead", "behind"), 0)
+            for match in _TRACK_COUNT_RE.finditer(track[0]):
+                counts[match.group(1)] = int(match.group(2))
+            branches.append(
+                (name, is_current, upstream_name, (counts["ahead"], counts["behind"]))
+            )
+        return branches
+
     def get_ahead_behind(self, branch: str, upstream: str) -> tuple[int, int] | None:
         """Get ahead/behind counts for branch vs upstream.
 
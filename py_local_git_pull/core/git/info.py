@@ -1,7 +1,7 @@
 """Repository info collection: status, branches, bare check."""
 
 from py_local_git_pull.core.git.runner import GitRunner
-from py_local_git_pull.config.defaults import BARE_REPO_VALUE
+from py_local_git_pull.config.defaults import BARE_REPO_BYTES, SHALLOW_REPO_BYTES
 
 
 class InfoOperations:
@@ -12,34 +12,19 @@ class InfoOperations:
 
     def is_bare(self) -> bool:
         """Check if repository is bare."""
-        code, out, _ = self._runner.run(["rev-parse", "--is-bare-repository"], check=False)
-        return code == 0 and out == BARE_REPO_VALUE
+        code, out, _ = self._runner.run_bytes(["rev-parse", "--is-bare-repository"])
+        return code == 0 and out == BARE_REPO_BYTES
+
+    def is_shallow(self) -> bool:
+        """Check if repository history is truncated by a shallow fetch or clone."""
+        code, out, _ = self._runner.run_bytes(["rev-parse", "--is-shallow-repository"])
+        return code == 0 and out == SHALLOW_REPO_BYTES
 
     def has_changes(self) -> bool:
         """Check if working tree has uncommitted changes."""
-        code, out, _ = self._runner.run(["status", "--porcelain"], check=False)
+        code, out, _ = self._runner.run_bytes(["status", "--porcelain"])
         return code == 0 and bool(out)
 
-    def get_local_branches(self) -> list[tuple[str, bool]]:
-        """Get local branches with current branch marker.
-
-        Returns:
-            List of (branch_name, is_current) tuples.
-        """
-        code, out, _ = self._runner.run(["branch", "--list"], check=False)
-        if code != 0 or not out:
-            return []
-
-        current = self.get_current_branch()
-        branches = []
-        for line in out.splitlines():
-            name = line.strip()
-            if name.startswith("* "):
-                name = name[2:]
-            if name:
-                branches.append((name, name == current))
-        return branches
-
     def get_current_branch(self) -> str | None:
         """Get current branch name."""
         code, out, _ = self._runner.run(["branch", "--show-current"], check=False)
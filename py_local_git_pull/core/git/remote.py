@@ -2,6 +2,7 @@
 
 import structlog
 
+from py_local_git_pull.config.defaults import DEFAULT_REMOTE
 from py_local_git_pull.core.git.runner import GitRunner
 
 log = structlog.get_logger()
@@ -34,6 +35,36 @@ class RemoteOperations:
             log.error("fetch_failed", error=str(e))
             return False
 
+    def fetched_remote(self, current_branch: str | None) -> str:
+        """Return the remote a bare ``git fetch`` reads from.
+
+        That is the current branch's configured remote, or the default remote.
+        """
+        if current_branch:
+            code, out, _ = self._runner.run(
+                ["config", "--get", f"branch.{current_branch}.remote"], check=False
+            )
+            if code == 0 and out:
+                return out
+        return DEFAULT_REMOTE
+
+    def fast_forward(self, upstream: str) -> tuple[bool, str | None]:
+        """Fast-forward the current branch to an already fetched upstream.
+
+        Unlike pull, this does not go back to the network.
+
+        Returns:
+            (success, error_message)
+        """
+        try:
+            self._runner.run(["merge", "--ff-only", upstream])
+            log.info("fast_forward_completed", upstream=upstream)
+            return True, None
+        except Exception as e:
+            error_msg = str(e)
+            log.error("fast_forward_failed", upstream=upstream, error=error_msg)
+            return False, error_msg
+
     def pull(self) -> tuple[bool, str | None]:
         """Pull current branch with fast-forward only.
 
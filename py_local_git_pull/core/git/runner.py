@@ -1,5 +1,7 @@
 """Git command execution with retry support."""
 
+from functools import cache
+import shutil
 import subprocess
 
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
@@ -8,12 +10,25 @@ from py_local_git_pull.config.defaults import DEFAULT_TIMEOUT_SECONDS
 from py_local_git_pull.exceptions.errors import GitCommandError
 
 
+@cache
+def git_executable() -> str:
+    """Resolve the git binary once.
+
+    subprocess only uses posix_spawn (no fork of the parent) when the program
+    is given with a directory component, so a bare "git" would force
+    fork+exec on every call. Keep cwd, preexec_fn and pass_fds unset on git
+    calls for the same reason.
+    """
+    return shutil.which("git") or "git"
+
+
 class GitRunner:
     """Execute git commands with configurable timeout and retry."""
 
     def __init__(self, repo_path: str, timeout: int = DEFAULT_TIMEOUT_SECONDS):
         self._repo_path = repo_path
         self._timeout = timeout
+        self._git_prefix = (git_executable(), "-C", repo_path)
 
     @property
     def repo_path(self) -> str:
@@ -39,7 +54,7 @@ class GitRunner:
         Raises:
             GitCommandError: If check=True and command fails.
         """
-        full_command = ["git", "-C", self._repo_path] + command
+        full_command = (*self._git_prefix, *command)
         effective_timeout = timeout or self._timeout
         try:
             process = subprocess.run(
@@ -74,6 +89,33 @@ class GitRunner:
                 ) from e
             return e.returncode, stdout, stderr
 
+    def run_bytes(
+        self,
+        command: list[str],
+        *,
+        timeout: int | None = None,
+    ) -> tuple[int, bytes, bytes]:
+        """Run a git command without decoding its output.
+
+        Meant for probes that only test output for emptiness or compare it
+        with a short ASCII value. Never raises on a non-zero exit.
+
+        Returns:
+            Tuple of (returncode, stdout, stderr) as stripped bytes.
+        """
+        full_command = (*self._git_prefix, *command)
+        effective_timeout = timeout or self._timeout
+        try:
+            process = subprocess.run(
+                full_command,
+                capture_output=True,
+                check=False,
+                timeout=effective_timeout,
+            )
+            return process.returncode, process.stdout.strip(), process.stderr.strip()
+        except subprocess.TimeoutExpired:
+            return 124, b"", f"git command timed out: {' '.join(full_command)}".encode()
+
     @staticmethod
     def _extract_output(output: str | bytes | None) -> str:
         """Extract string output from subprocess result."""
@@ -76,7 +76,7 @@ class RunEventType(str, Enum):
     RUN_COMPLETED = "run_completed"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SuggestedAction:
     label: str
     command: str | None
@@ -84,7 +84,7 @@ class SuggestedAction:
     auto_fixable: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FailureRecord:
     kind: FailureKind
     summary: str
@@ -94,7 +94,7 @@ class FailureRecord:
     suggested_actions: tuple[SuggestedAction, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BranchInspection:
     name: str
     is_current: bool
@@ -106,7 +106,7 @@ class BranchInspection:
     behind: int | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RepoInspection:
     repo_name: str
     path: str
@@ -121,7 +121,7 @@ class RepoInspection:
     risk_flags: tuple[RiskFlag, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RepoSyncPlan:
     repo_name: str
     path: str
@@ -134,7 +134,7 @@ class RepoSyncPlan:
     attention_reason: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BranchOutcome:
     name: str
     status: BranchStatus
@@ -146,7 +146,7 @@ class BranchOutcome:
     failure: FailureRecord | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RepoOutcome:
     repo_name: str
     path: str
@@ -161,7 +161,7 @@ class RepoOutcome:
     notes: tuple[str, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunEvent:
     run_id: str
     event_type: RunEventType
@@ -173,7 +173,7 @@ class RunEvent:
     failure_kind: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunSummary:
     synced: int
     partial: int
@@ -181,7 +181,7 @@ class RunSummary:
     failed: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunRecord:
     run_id: str
     command: str
@@ -194,7 +194,7 @@ class RunRecord:
     summary: RunSummary
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SyncOptions:
     auto_upstream: bool = False
     skip_non_exist: bool = False
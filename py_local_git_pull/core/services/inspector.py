@@ -1,7 +1,10 @@
 """Repository inspection service."""
 
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from py_local_git_pull.config.defaults import DEFAULT_SCAN_WORKERS
 from py_local_git_pull.core.git.branch import BranchOperations
 from py_local_git_pull.core.git.info import InfoOperations
 from py_local_git_pull.core.git.runner import GitRunner
@@ -60,28 +63,25 @@ class RepoInspector:
         info_ops = InfoOperations(runner)
         branch_ops = BranchOperations(runner)
 
-        current_branch = info_ops.get_current_branch()
+        tracking = branch_ops.get_branch_tracking(include_counts=include_branch_deltas)
+        current_branch = next((name for name, is_current, _, _ in tracking if is_current), None)
+        if current_branch is None:
+            # Detached HEAD or an unborn branch; only git can tell them apart.
+            current_branch = info_ops.get_current_branch()
         is_bare = info_ops.is_bare()
         has_changes = info_ops.has_changes()
 
         remote_branches = branch_ops.get_remote_branches()
-        local_branches = info_ops.get_local_branches()
 
         branches = []
-        for name, is_current in local_branches:
-            exists_remote = name in remote_branches
-            has_upstream, upstream_name, _ = branch_ops.set_upstream(name, auto_upstream=False)
-            ahead_behind = None
-            if has_upstream and include_branch_deltas:
-                ahead_behind = branch_ops.get_ahead_behind(name, upstream_name)
-
+        for name, is_current, upstream_name, ahead_behind in tracking:
             branches.append(
                 BranchInspection(
                     name=name,
                     is_current=is_current,
                     exists_locally=True,
-                    exists_remotely=exists_remote,
-                    has_upstream=has_upstream,
+                    exists_remotely=name in remote_branches,
+                    has_upstream=bool(upstream_name),
                     upstream_name=upstream_name,
                     ahead=ahead_behind[0] if ahead_behind else None,
                     behind=ahead_behind[1] if ahead_behind else None,
@@ -117,14 +117,39 @@ class RepoInspector:
         recursive: bool,
         max_depth: int,
         include_branch_deltas: bool = True,
+        workers: int = DEFAULT_SCAN_WORKERS,
+        prune: bool = True,
     ) -> tuple[RepoInspection, ...]:
         """Scan a path for repositories and inspect each one."""
         if recursive:
-            repo_paths = find_git_repos(path, max_depth)
+            repo_paths = find_git_repos(path, max_depth, prune=prune)
         else:
             repo_paths = [path] if is_git_repo(path) else []
 
-        return tuple(
-            self.inspect_repo(rp, include_branch_deltas=include_branch_deltas)
-            for rp in repo_paths
+        return self.inspect_repos(
+            repo_paths, include_branch_deltas=include_branch_deltas, workers=workers
         )
+
+    def inspect_repos(
+        self,
+        repo_paths: Sequence[str],
+        *,
+        include_branch_deltas: bool = True,
+        workers: int = DEFAULT_SCAN_WORKERS,
+    ) -> tuple[RepoInspection, ...]:
+        """Inspect several repositories.
+
+        Repositories are inspected on a thread pool, since the work is git
+        subprocesses; results keep the order of repo_paths.
+        """
+        if len(repo_paths) <= 1:
+            return tuple(
+                self.inspect_repo(rp, include_branch_deltas=include_branch_deltas)
+                for rp in repo_paths
+            )
+
+        def inspect(repo_path: str) -> RepoInspection:
+            return self.inspect_repo(repo_path, include_branch_deltas=include_branch_deltas)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(repo_paths)))) as pool:
+            return tuple(pool.map(inspect, repo_paths))
@@ -2,6 +2,7 @@
 
 import structlog
 
+from py_local_git_pull.config.defaults import DEFAULT_REMOTE
 from py_local_git_pull.core.failure.catalog import classify_git_failure
 from py_local_git_pull.core.git.branch import BranchOperations
 from py_local_git_pull.core.git.info import InfoOperations
@@ -40,6 +41,7 @@ class SyncService:
         self._stash_ops = stash_ops
         self._remote_ops = remote_ops
         self._info_ops = info_ops
+        self._remote_fetched = False
 
     def sync_repo(
         self,
@@ -68,6 +70,13 @@ class SyncService:
                 stashed=False,
                 failure=failure,
             )
+        # A shallow history cuts the ancestry a local merge --ff-only needs
+        # ("refusing to merge unrelated histories"), so those repos keep pull.
+        self._remote_fetched = (
+            not options.depth
+            and not self._info_ops.is_shallow()
+            and self._remote_ops.fetched_remote(current_branch) == DEFAULT_REMOTE
+        )
 
         stashed = False
         if (
@@ -181,8 +190,17 @@ class SyncService:
         return self._execute_pull(branch, is_current, upstream_name)
 
     def _execute_pull(self, branch: str, is_current: bool, upstream_name: str) -> BranchOutcome:
-        """Execute pull and return appropriate outcome."""
-        success, pull_error = self._remote_ops.pull()
+        """Execute pull and return appropriate outcome.
+
+        Upstreams on the default remote were refreshed by the fetch at the
+        start of sync_repo, so they are fast-forwarded locally instead of
+        pulled, which would fetch again for every branch. Shallow fetches
+        keep using pull.
+        """
+        if self._remote_fetched and upstream_name.startswith(f"{DEFAULT_REMOTE}/"):
+            success, pull_error = self._remote_ops.fast_forward(upstream_name)
+        else:
+            success, pull_error = self._remote_ops.pull()
         if not success:
             return self._create_failed_outcome(
                 branch, is_current, classify_git_failure(pull_error), upstream_name
@@ -77,6 +77,7 @@ async def _execute_repo_sync(
     service_factory,
     options: SyncOptions,
     semaphore: anyio.Semaphore,
+    limiter: anyio.CapacityLimiter,
     lock: anyio.Lock,
     outcomes: list[RepoOutcome],
     emit,
@@ -107,7 +108,7 @@ async def _execute_repo_sync(
 
         service = service_factory(inspection.path)
         sync_call = partial(service.sync_repo, inspection, plan, options)
-        outcome = await anyio.to_thread.run_sync(sync_call)
+        outcome = await anyio.to_thread.run_sync(sync_call, limiter=limiter)
 
         async with lock:
             outcomes.append(outcome)
@@ -170,6 +171,8 @@ async def execute_sync_run(
     outcomes: list[RepoOutcome] = []
     lock = anyio.Lock()
     semaphore = anyio.Semaphore(max(1, workers))
+    # anyio's default thread limiter (40) would silently cap larger --workers values.
+    limiter = anyio.CapacityLimiter(max(1, workers))
 
     options = SyncOptions(
         auto_upstream=auto_upstream,
@@ -195,6 +198,7 @@ async def execute_sync_run(
             service_factory=service_factory,
             options=options,
             semaphore=semaphore,
+            limiter=limiter,
             lock=lock,
             outcomes=outcomes,
             emit=emit,
@@ -1,7 +1,8 @@
 """Persist and load run records."""
 
+from dataclasses import fields, is_dataclass
+from functools import cache
 import json
-from dataclasses import asdict
 from pathlib import Path
 
 from py_local_git_pull.core.models import (
@@ -20,6 +21,23 @@ from py_local_git_pull.core.models import (
 )
 
 
+@cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+def json_default(obj: object) -> object:
+    """``json.dumps`` default hook for the frozen models.
+
+    Dataclasses are turned into a dict one level at a time as the encoder
+    reaches them, instead of deep-copying the whole record up front the way
+    ``asdict`` does.
+    """
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {name: getattr(obj, name) for name in _field_names(type(obj))}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def _record_path(runs_dir: Path, run_id: str) -> Path:
     return runs_dir / f"{run_id}.json"
 
@@ -27,7 +45,7 @@ def _record_path(runs_dir: Path, run_id: str) -> Path:
 def write_run_record(runs_dir: Path, run: RunRecord) -> Path:
     runs_dir.mkdir(parents=True, exist_ok=True)
     path = _record_path(runs_dir, run.run_id)
-    path.write_text(json.dumps(asdict(run), ensure_ascii=False, indent=2), encoding="utf-8")
+    path.write_text(json.dumps(run, ensure_ascii=False, indent=2, default=json_default), encoding="utf-8")
     return path
 
 
@@ -1,14 +1,30 @@
-"""Task-console UI exports."""
+"""Task-console UI exports.
+
+Exports resolve lazily (PEP 562) so that importing one view module, or the
+json/jsonl CLI paths, does not pull in every Rich renderer.
+"""
+
+from importlib import import_module
+
+_EXPORTS: dict[str, str] = {
+    "render_sync_header": ".dashboard",
+    "render_plan_panel": ".dashboard",
+    "render_summary_panel": ".dashboard",
+    "render_next_actions": ".dashboard",
+    "render_repo_events": ".events",
+    "render_scan_summary": ".summary",
+    "render_doctor_result": ".doctor_view",
+}
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
-from .dashboard import (
-    render_next_actions,
-    render_plan_panel,
-    render_summary_panel,
-    render_sync_header,
-)
-from .doctor_view import render_doctor_result
-from .events import render_repo_events
-from .summary import render_scan_summary
 
 __all__ = [
     "render_sync_header",
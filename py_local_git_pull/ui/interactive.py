@@ -13,7 +13,7 @@ class PickerPreset(str, Enum):
     RISKY_ONLY = "risky_only"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PickerEntry:
     inspection: RepoInspection
     label: str
@@ -40,32 +40,32 @@ def recommended_action_for_repo(inspection: RepoInspection) -> str:
     return "sync now"
 
 
-def _picker_sort_key(inspection: RepoInspection) -> tuple[int, int, str]:
+_ACTION_RANK: dict[str, int] = {
+    "sync now": 0,
+    "double-check before sync": 1,
+    "review before sync": 2,
+}
+_RISK_RANK: dict[RiskLevel, int] = {
+    RiskLevel.LOW: 0,
+    RiskLevel.MEDIUM: 1,
+    RiskLevel.HIGH: 2,
+}
+
+
+def _picker_sort_key(entry: PickerEntry) -> tuple[int, int, str]:
     """Sort safer repos first, then by risk level, then name."""
-    action_rank = {
-        "sync now": 0,
-        "double-check before sync": 1,
-        "review before sync": 2,
-    }
-    risk_rank = {
-        RiskLevel.LOW: 0,
-        RiskLevel.MEDIUM: 1,
-        RiskLevel.HIGH: 2,
-    }
-    action = recommended_action_for_repo(inspection)
     return (
-        action_rank[action],
-        risk_rank[inspection.risk_level],
-        inspection.repo_name.lower(),
+        _ACTION_RANK[entry.recommended_action],
+        _RISK_RANK[entry.inspection.risk_level],
+        entry.inspection.repo_name.lower(),
     )
 
 
-def _build_entry_label(inspection: RepoInspection) -> str:
+def _build_entry_label(inspection: RepoInspection, action: str) -> str:
     """Build compact label for picker entry."""
     branch = inspection.current_branch or "detached"
     changes = "dirty" if inspection.has_changes else "clean"
     flags = ",".join(flag.name for flag in inspection.risk_flags[:2]) or "safe"
-    action = recommended_action_for_repo(inspection)
     return (
         f"{inspection.repo_name:<24} "
         f"{action:<24} "
@@ -77,18 +77,23 @@ def _build_entry_label(inspection: RepoInspection) -> str:
 
 
 def build_picker_entries(inspections: tuple[RepoInspection, ...]) -> tuple[PickerEntry, ...]:
-    """Build picker entries with compact labels and default selection state."""
+    """Build picker entries with compact labels and default selection state.
+
+    The recommended action is derived once per repo and reused for the label
+    and the sort order.
+    """
     entries: list[PickerEntry] = []
-    for inspection in sorted(inspections, key=_picker_sort_key):
-        label = _build_entry_label(inspection)
+    for inspection in inspections:
+        action = recommended_action_for_repo(inspection)
         entries.append(
             PickerEntry(
                 inspection=inspection,
-                label=label,
+                label=_build_entry_label(inspection, action),
                 checked=not inspection.risk_flags,
-                recommended_action=recommended_action_for_repo(inspection),
+                recommended_action=action,
             )
         )
+    entries.sort(key=_picker_sort_key)
     return tuple(entries)
 
 
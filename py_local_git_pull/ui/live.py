@@ -12,6 +12,20 @@ from rich.table import Table
 
 from py_local_git_pull.core.models import RunEvent, RunEventType
 
+# State only changes when a repo event arrives (seconds apart while git runs),
+# so a slower redraw tick loses nothing visible.
+_REFRESH_PER_SECOND = 4
+
+# Static, so built once rather than on every render.
+_LEGEND_PANEL = Panel(
+    "queued: waiting for worker\n"
+    "running: currently syncing\n"
+    "partial: mixed branch outcome\n"
+    "failed: inspect with doctor",
+    title="STATUS LEGEND",
+    border_style="blue",
+)
+
 
 def summarize_live_state(events: tuple[RunEvent, ...]) -> dict[str, int]:
     """Summarize repo progress from the latest event per repo."""
@@ -19,7 +33,11 @@ def summarize_live_state(events: tuple[RunEvent, ...]) -> dict[str, int]:
     for event in events:
         if event.repo_name:
             latest_by_repo[event.repo_name] = event
+    return _summarize_latest(latest_by_repo)
 
+
+def _summarize_latest(latest_by_repo: dict[str, RunEvent]) -> dict[str, int]:
+    """Summarize repo progress from an already reduced latest-event-per-repo map."""
     summary = {
         "total": len(latest_by_repo),
         "queued": 0,
@@ -51,11 +69,13 @@ class LiveSyncRenderer:
     def __init__(self, console, max_events: int = 12):
         self._console = console
         self._events: deque[RunEvent] = deque(maxlen=max_events)
-        self._all_events: list[RunEvent] = []
+        # Latest event per repo, kept up to date on push so a render does not
+        # rescan the whole event history.
+        self._latest_by_repo: dict[str, RunEvent] = {}
         self._live: Live | None = None
 
     def __enter__(self):
-        self._live = Live(console=self._console, refresh_per_second=8)
+        self._live = Live(console=self._console, refresh_per_second=_REFRESH_PER_SECOND)
         self._live.__enter__()
         self._live.update(self._render())
         return self
@@ -66,7 +86,8 @@ class LiveSyncRenderer:
 
     def push(self, event: RunEvent) -> None:
         self._events.append(event)
-        self._all_events.append(event)
+        if event.repo_name:
+            self._latest_by_repo[event.repo_name] = event
         if self._live is not None:
             self._live.update(self._render())
 
@@ -94,21 +115,14 @@ class LiveSyncRenderer:
         return table
 
     def _render(self):
-        summary = summarize_live_state(tuple(self._all_events))
+        summary = _summarize_latest(self._latest_by_repo)
         progress = self._build_progress_table(summary)
         recent = self._build_recent_events_table()
 
         top = Columns(
             [
                 Panel(progress, title="PROGRESS", border_style="cyan"),
-                Panel(
-                    "queued: waiting for worker\n"
-                    "running: currently syncing\n"
-                    "partial: mixed branch outcome\n"
-                    "failed: inspect with doctor",
-                    title="STATUS LEGEND",
-                    border_style="blue",
-                ),
+                _LEGEND_PANEL,
             ],
             equal=True,
             expand=True,
@@ -3,9 +3,14 @@
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 
 
 def render_runs_list(console: Console, runs) -> None:
+    if not runs:
+        console.print("[yellow]No recorded runs found.[/]")
+        return
+
     table = Table(title="RUNS")
     table.add_column("Run ID", width=26)
     table.add_column("Policy", width=10)
@@ -20,10 +25,6 @@ def render_runs_list(console: Console, runs) -> None:
             str(run.summary.failed),
         )
 
-    if not runs:
-        console.print("[yellow]No recorded runs found.[/]")
-        return
-
     console.print(table)
 
 
@@ -43,6 +44,9 @@ def render_run_detail(console: Console, run) -> None:
     )
     console.print(Panel(summary, title="RUN DETAIL", border_style="cyan"))
 
+    if not run.outcomes:
+        return
+
     outcomes = Table(title="REPO OUTCOMES")
     outcomes.add_column("Repo", width=20)
     outcomes.add_column("Status", width=12)
@@ -50,12 +54,12 @@ def render_run_detail(console: Console, run) -> None:
     outcomes.add_column("Failure")
 
     for outcome in run.outcomes:
+        # Text cells skip the markup parser; repo and branch names are plain data.
         outcomes.add_row(
-            outcome.repo_name,
+            Text(outcome.repo_name),
             outcome.status.value,
-            outcome.current_branch or "-",
+            Text(outcome.current_branch or "-"),
             outcome.failure.kind.value if outcome.failure else "-",
         )
 
-    if run.outcomes:
-        console.print(outcomes)
+    console.print(outcomes)
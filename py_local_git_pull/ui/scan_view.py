@@ -5,14 +5,18 @@ from collections import Counter
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 
 from py_local_git_pull.core.models import RepoInspection, RiskLevel
 
-_RISK_STYLE: dict[RiskLevel, str] = {
-    RiskLevel.LOW: "green",
-    RiskLevel.MEDIUM: "yellow",
-    RiskLevel.HIGH: "red",
+# Prebuilt cells: Text is rendered as-is, while str cells go through the markup parser.
+_RISK_TEXT: dict[RiskLevel, Text] = {
+    RiskLevel.LOW: Text(RiskLevel.LOW.value, style="green"),
+    RiskLevel.MEDIUM: Text(RiskLevel.MEDIUM.value, style="yellow"),
+    RiskLevel.HIGH: Text(RiskLevel.HIGH.value, style="red"),
 }
+_DETACHED_TEXT = Text("(detached)")
+_NO_FLAGS_TEXT = Text("none")
 
 
 def render_scan_summary(
@@ -68,13 +72,13 @@ def render_scan_summary(
     table.add_column("Flags")
 
     for insp in inspections:
-        risk_style = _RISK_STYLE.get(insp.risk_level, "white")
-        flags = ", ".join(f.value for f in insp.risk_flags) or "none"
+        risk = _RISK_TEXT.get(insp.risk_level) or Text(insp.risk_level.value, style="white")
+        flags = ", ".join(f.value for f in insp.risk_flags)
         table.add_row(
-            insp.repo_name,
-            insp.current_branch or "(detached)",
-            f"[{risk_style}]{insp.risk_level.value}[/]",
-            flags,
+            Text(insp.repo_name),
+            Text(insp.current_branch) if insp.current_branch else _DETACHED_TEXT,
+            risk,
+            Text(flags) if flags else _NO_FLAGS_TEXT,
         )
 
     console.print(table)
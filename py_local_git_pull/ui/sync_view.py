@@ -5,14 +5,16 @@ from collections import Counter
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 
 from py_local_git_pull.core.models import RepoInspection, RepoOutcome, RepoStatus
 
-_STATUS_STYLE: dict[RepoStatus, str] = {
-    RepoStatus.SYNCED: "[green]✓ synced",
-    RepoStatus.FAILED: "[red]✗ failed",
-    RepoStatus.SKIPPED: "[yellow]⊘ skipped",
-    RepoStatus.PARTIAL: "[orange3]◐ partial",
+# Prebuilt cells: Text is rendered as-is, while str cells go through the markup parser.
+_STATUS_TEXT: dict[RepoStatus, Text] = {
+    RepoStatus.SYNCED: Text("✓ synced", style="green"),
+    RepoStatus.FAILED: Text("✗ failed", style="red"),
+    RepoStatus.SKIPPED: Text("⊘ skipped", style="yellow"),
+    RepoStatus.PARTIAL: Text("◐ partial", style="orange3"),
 }
 
 
@@ -50,9 +52,9 @@ def render_repo_events(console: Console, outcomes: tuple[RepoOutcome, ...]) -> N
     table.add_column("Detail")
 
     for idx, outcome in enumerate(outcomes, start=1):
-        status_style = _STATUS_STYLE.get(outcome.status, outcome.status.value)
+        status = _STATUS_TEXT.get(outcome.status) or Text(outcome.status.value)
         detail = outcome.failure.kind.value if outcome.failure else (outcome.current_branch or "-")
-        table.add_row(str(idx), outcome.repo_name, status_style, detail)
+        table.add_row(str(idx), Text(outcome.repo_name), status, Text(detail))
 
     console.print(table)
 
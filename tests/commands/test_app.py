@@ -21,3 +21,39 @@ def test_sync_help_mentions_branch_option() -> None:
     assert "--branch" in result.stdout
     assert "--interactive" in result.stdout
     assert "--policy" in result.stdout
+
+
+def _scan_logging_one_of_each_level(monkeypatch) -> None:
+    import structlog
+
+    def fake_inspect_path(self, path, recursive, max_depth, prune=True):
+        log = structlog.get_logger()
+        log.info("probe_info")
+        log.warning("probe_warning")
+        log.error("probe_error")
+        return ()
+
+    monkeypatch.setattr("py_local_git_pull.cli.scan.RepoInspector.inspect_path", fake_inspect_path)
+
+
+def test_logs_default_to_warning_on_stderr(monkeypatch) -> None:
+    _scan_logging_one_of_each_level(monkeypatch)
+
+    result = runner.invoke(app, ["scan", "/tmp/demo", "--output", "json"])
+    assert result.exit_code == 0
+    assert "probe_info" not in result.stderr
+    assert "probe_warning" in result.stderr
+    assert "probe_" not in result.stdout
+
+
+def test_verbose_shows_info_and_quiet_keeps_errors_only(monkeypatch) -> None:
+    _scan_logging_one_of_each_level(monkeypatch)
+
+    result = runner.invoke(app, ["-v", "scan", "/tmp/demo", "--output", "json"])
+    assert result.exit_code == 0
+    assert "probe_info" in result.stderr
+
+    result = runner.invoke(app, ["-q", "scan", "/tmp/demo", "--output", "json"])
+    assert result.exit_code == 0
+    assert "probe_warning" not in result.stderr
+    assert "probe_error" in result.stderr
@@ -20,7 +20,7 @@ def test_scan_command_renders_inventory_risks_and_next(monkeypatch) -> None:
 
     monkeypatch.setattr(
         "py_local_git_pull.cli.scan.RepoInspector.inspect_path",
-        lambda self, path, recursive, max_depth: (
+        lambda self, path, recursive, max_depth, prune=True: (
             RepoInspection(
                 repo_name="demo",
                 path="/tmp/demo",
@@ -50,7 +50,7 @@ def test_scan_json_uses_schema_v3(monkeypatch) -> None:
 
     monkeypatch.setattr(
         "py_local_git_pull.cli.scan.RepoInspector.inspect_path",
-        lambda self, path, recursive, max_depth: (
+        lambda self, path, recursive, max_depth, prune=True: (
             RepoInspection(
                 repo_name="demo",
                 path="/tmp/demo",
@@ -79,7 +79,7 @@ def test_scan_jsonl_streams_repo_rows_and_summary(monkeypatch) -> None:
 
     monkeypatch.setattr(
         "py_local_git_pull.cli.scan.RepoInspector.inspect_path",
-        lambda self, path, recursive, max_depth: (
+        lambda self, path, recursive, max_depth, prune=True: (
             RepoInspection(
                 repo_name="demo",
                 path="/tmp/demo",
@@ -103,3 +103,20 @@ def test_scan_jsonl_streams_repo_rows_and_summary(monkeypatch) -> None:
     assert lines[0]["repo"]["repo_name"] == "demo"
     assert lines[-1]["event"] == "scan_summary"
     assert lines[-1]["summary"]["total"] == 1
+    assert lines[-1]["summary"]["attention"] == 1
+    assert lines[-1]["summary"]["risk_counts"] == {"low": 0, "medium": 1, "high": 0}
+
+
+def test_scan_no_prune_descends_into_build_dirs(monkeypatch) -> None:
+    calls: list[bool] = []
+
+    def fake_inspect_path(self, path, recursive, max_depth, prune=True):
+        calls.append(prune)
+        return ()
+
+    monkeypatch.setattr("py_local_git_pull.cli.scan.RepoInspector.inspect_path", fake_inspect_path)
+
+    assert runner.invoke(app, ["scan", "/tmp/demo", "-r", "--output", "json"]).exit_code == 0
+    result = runner.invoke(app, ["scan", "/tmp/demo", "-r", "--no-prune", "--output", "json"])
+    assert result.exit_code == 0
+    assert calls == [True, False]
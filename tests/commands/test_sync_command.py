@@ -112,7 +112,7 @@ def _patch_sync_command(
     patched_inspections = inspections or (_make_inspection(),)
     monkeypatch.setattr(
         "py_local_git_pull.cli.sync.RepoInspector.inspect_path",
-        lambda self, path, recursive, max_depth, include_branch_deltas=True: patched_inspections,
+        lambda self, path, recursive, max_depth, include_branch_deltas=True, prune=True: patched_inspections,
     )
     monkeypatch.setattr(
         "py_local_git_pull.cli.sync.run_sync_flow",
@@ -162,7 +162,7 @@ def test_sync_interactive_uses_prompt_selection(monkeypatch) -> None:
     inspect_path_calls: list[tuple[str, bool]] = []
     inspect_repo_calls: list[tuple[str, bool]] = []
 
-    def fake_inspect_path(self, path, recursive, max_depth, include_branch_deltas=True):
+    def fake_inspect_path(self, path, recursive, max_depth, include_branch_deltas=True, prune=True):
         inspect_path_calls.append((path, include_branch_deltas))
         return (_make_inspection(path),)
 
@@ -197,7 +197,7 @@ def test_sync_interactive_uses_prompt_selection(monkeypatch) -> None:
 def test_sync_command_handles_unexpected_errors_without_traceback(monkeypatch) -> None:
     monkeypatch.setattr(
         "py_local_git_pull.cli.sync.RepoInspector.inspect_path",
-        lambda self, path, recursive, max_depth, include_branch_deltas=True: (_make_inspection(),),
+        lambda self, path, recursive, max_depth, include_branch_deltas=True, prune=True: (_make_inspection(),),
     )
     monkeypatch.setattr(
         "py_local_git_pull.cli.sync.run_sync_flow",
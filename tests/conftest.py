@@ -0,0 +1,53 @@
+"""Shared fixtures for tests that drive real git repositories."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from py_local_git_pull.core.git.runner import GitRunner
+
+
+@pytest.fixture
+def record_git_commands(monkeypatch) -> Callable[[GitRunner], list[list[str]]]:
+    """Record every command a runner executes from now on; returns the live list."""
+
+    def record(runner: GitRunner) -> list[list[str]]:
+        commands: list[list[str]] = []
+        original_run = runner.run
+
+        def recording_run(command, **kwargs):
+            commands.append(command)
+            return original_run(command, **kwargs)
+
+        monkeypatch.setattr(runner, "run", recording_run)
+        return commands
+
+    return record
+
+
+@pytest.fixture
+def pushed_repo(tmp_path: Path) -> GitRunner:
+    """A repo at tmp_path/"work" with one commit on main, pushed with -u to a bare origin.
+
+    The bare remote lives at tmp_path/"remote.git" and its HEAD points at main.
+    """
+    remote_path = tmp_path / "remote.git"
+    remote_path.mkdir()
+    remote = GitRunner(str(remote_path))
+    remote.run(["init", "--bare"])
+    remote.run(["symbolic-ref", "HEAD", "refs/heads/main"])
+
+    work_path = tmp_path / "work"
+    work_path.mkdir()
+    runner = GitRunner(str(work_path))
+    runner.run(["init"])
+    runner.run(["config", "user.email", "test@test.com"])
+    runner.run(["config", "user.name", "Test"])
+    (work_path / "file.txt").write_text("hello")
+    runner.run(["add", "."])
+    runner.run(["commit", "-m", "init"])
+    runner.run(["branch", "-M", "main"])
+    runner.run(["remote", "add", "origin", str(remote_path)])
+    runner.run(["push", "-u", "origin", "main"])
+    return runner
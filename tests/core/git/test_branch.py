@@ -31,3 +31,68 @@ def test_get_remote_branches_empty(tmp_path):
     ops = BranchOperations(runner)
     branches = ops.get_remote_branches()
     assert branches == set()
+
+
+def test_branch_exists_locally_uses_cached_ref_listing(tmp_path, record_git_commands):
+    runner = _make_runner(tmp_path)
+    (tmp_path / "file.txt").write_text("hello")
+    runner.run(["add", "."])
+    runner.run(["commit", "-m", "init"])
+    runner.run(["branch", "feature/x"])
+
+    commands = record_git_commands(runner)
+    ops = BranchOperations(runner)
+    assert ops.branch_exists_locally("feature/x") is True
+    assert ops.branch_exists_locally("feature") is False
+    assert [command[0] for command in commands].count("for-each-ref") == 1
+
+
+def test_get_branch_tracking_reads_upstream_and_counts(pushed_repo, record_git_commands):
+    runner = pushed_repo
+    runner.run(["commit", "--allow-empty", "-m", "local"])
+    runner.run(["branch", "feature/x"])
+    runner.run(["branch", "gone"])
+    runner.run(["config", "branch.gone.remote", "origin"])
+    runner.run(["config", "branch.gone.merge", "refs/heads/missing"])
+    runner.run(["tag", "main"])
+
+    ops = BranchOperations(runner)
+    assert ops.get_branch_tracking() == [
+        ("feature/x", False, "", None),
+        ("gone", False, "", None),
+        ("main", True, "origin/main", (1, 0)),
+    ]
+
+    commands = record_git_commands(runner)
+    assert ops.get_branch_tracking(include_counts=False) == [
+        ("feature/x", False, "", None),
+        ("gone", False, "", None),
+        ("main", True, "origin/main", None),
+    ]
+    assert not any("upstream:track" in arg for command in commands for arg in command)
+
+
+def test_get_remote_branches_strips_remote_prefix_and_head(tmp_path):
+    runner = _make_runner(tmp_path)
+    (tmp_path / "file.txt").write_text("hello")
+    runner.run(["add", "."])
+    runner.run(["commit", "-m", "init"])
+    for ref in ("refs/remotes/origin/main", "refs/remotes/origin/feature/x"):
+        runner.run(["update-ref", ref, "HEAD"])
+    runner.run(["symbolic-ref", "refs/remotes/origin/HEAD", "refs/remotes/origin/main"])
+    runner.run(["update-ref", "refs/remotes/upstream/other", "HEAD"])
+
+    ops = BranchOperations(runner)
+    assert ops.get_remote_branches() == {"main", "feature/x"}
+
+
+def test_branch_exists_locally_when_tag_shares_the_name(tmp_path):
+    runner = _make_runner(tmp_path)
+    (tmp_path / "file.txt").write_text("hello")
+    runner.run(["add", "."])
+    runner.run(["commit", "-m", "init"])
+    runner.run(["branch", "release"])
+    runner.run(["tag", "release"])
+
+    ops = BranchOperations(runner)
+    assert ops.branch_exists_locally("release") is True
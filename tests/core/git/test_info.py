@@ -27,10 +27,3 @@ def test_has_changes_true_after_modify(tmp_path):
     ops = InfoOperations(runner)
     (tmp_path / "file.txt").write_text("hello")
     assert ops.has_changes() is True
-
-
-def test_get_local_branches_empty(tmp_path):
-    runner = _make_runner(tmp_path)
-    ops = InfoOperations(runner)
-    branches = ops.get_local_branches()
-    assert branches == []
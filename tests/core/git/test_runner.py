@@ -1,6 +1,8 @@
+import os
+
 import pytest
 
-from py_local_git_pull.core.git.runner import GitRunner
+from py_local_git_pull.core.git.runner import GitRunner, git_executable
 from py_local_git_pull.exceptions.errors import GitCommandError
 
 
@@ -22,3 +24,16 @@ def test_run_check_true_raises(tmp_path):
     runner = GitRunner(str(tmp_path))
     with pytest.raises(GitCommandError):
         runner.run(["nonexistent"], check=True)
+
+
+def test_run_bytes_returns_undecoded_output(tmp_path):
+    runner = GitRunner(str(tmp_path))
+    runner.run(["init"])
+    code, out, _ = runner.run_bytes(["rev-parse", "--is-bare-repository"])
+    assert code == 0
+    assert out == b"false"
+
+
+def test_git_executable_is_resolved_to_a_path():
+    # A directory component lets subprocess use posix_spawn instead of fork.
+    assert os.path.dirname(git_executable())
@@ -1,5 +1,7 @@
 """Tests for SyncService."""
 
+from pathlib import Path
+
 from py_local_git_pull.core.failure.catalog import classify_git_failure
 from py_local_git_pull.core.git.branch import BranchOperations
 from py_local_git_pull.core.git.info import InfoOperations
@@ -9,6 +11,7 @@ from py_local_git_pull.core.git.stash import StashOperations
 from py_local_git_pull.core.models import (
     BranchOutcome,
     BranchStatus,
+    FailureKind,
     PlanAction,
     RepoInspection,
     RepoStatus,
@@ -276,3 +279,62 @@ class TestBuildSyncPlan:
         plan = build_sync_plan(inspection, branches=(), no_stash=False)
         assert plan.needs_attention is True
         assert "no_upstream" in plan.attention_reason
+
+
+class TestSyncServiceFastForward:
+    @staticmethod
+    def _clone_behind_remote(seed):
+        """Clone origin next to the seed repo, then push one more seed commit."""
+        seed_path = Path(seed.repo_path)
+        local_path = seed_path.parent / "local"
+        seed.run(["clone", str(seed_path.parent / "remote.git"), str(local_path)])
+
+        (seed_path / "file.txt").write_text("updated")
+        seed.run(["commit", "-am", "update"])
+        seed.run(["push", "origin", "main"])
+        return GitRunner(str(local_path))
+
+    @staticmethod
+    def _sync(runner, depth):
+        service = SyncService(
+            runner=runner,
+            branch_ops=BranchOperations(runner),
+            stash_ops=StashOperations(runner),
+            remote_ops=RemoteOperations(runner),
+            info_ops=InfoOperations(runner),
+        )
+        local_path = Path(runner.repo_path)
+        return service.sync_repo(
+            _make_inspection(local_path, current_branch="main"),
+            _make_plan(local_path),
+            SyncOptions(auto_upstream=False, skip_non_exist=True, depth=depth),
+        )
+
+    def test_sync_fast_forwards_from_initial_fetch_without_pull(
+        self, pushed_repo, record_git_commands
+    ):
+        """Upstreams on origin are updated from the first fetch, not a pull per branch."""
+        runner = self._clone_behind_remote(pushed_repo)
+        commands = record_git_commands(runner)
+        outcome = self._sync(runner, depth=0)
+
+        subcommands = [command[0] for command in commands]
+        assert outcome.status is RepoStatus.SYNCED
+        assert "pull" not in subcommands
+        assert subcommands.count("fetch") == 1
+        _, local_head, _ = runner.run(["rev-parse", "HEAD"])
+        _, seed_head, _ = pushed_repo.run(["rev-parse", "HEAD"])
+        assert local_head == seed_head
+
+    def test_shallow_fetch_keeps_pull(self, pushed_repo, record_git_commands):
+        """A --depth fetch truncates history, so merge --ff-only is not attempted."""
+        runner = self._clone_behind_remote(pushed_repo)
+        commands = record_git_commands(runner)
+        outcome = self._sync(runner, depth=1)
+
+        subcommands = [command[0] for command in commands]
+        assert "merge" not in subcommands
+        assert "pull" in subcommands
+        # The shallow graft makes local and origin/main look unrelated; pull
+        # reports that as a fast-forward conflict rather than an unknown error.
+        assert outcome.branch_outcomes[0].failure.kind is FailureKind.PULL_FF_CONFLICT
@@ -1,3 +1,5 @@
+from py_local_git_pull.core.git.info import InfoOperations
+from py_local_git_pull.core.git.runner import GitRunner
 from py_local_git_pull.core.models import RiskFlag, RiskLevel
 from py_local_git_pull.core.services.inspector import RepoInspector, derive_risk_state
 
@@ -27,7 +29,7 @@ def test_detached_head_raises_high_risk() -> None:
 
 
 def test_inspect_repo_can_skip_ahead_behind_for_lightweight_mode(monkeypatch) -> None:
-    calls = {"ahead_behind": 0}
+    calls: list[bool] = []
 
     class FakeInfoOps:
         def __init__(self, runner) -> None:
@@ -42,9 +44,6 @@ def test_inspect_repo_can_skip_ahead_behind_for_lightweight_mode(monkeypatch) ->
         def has_changes(self) -> bool:
             return False
 
-        def get_local_branches(self) -> list[tuple[str, bool]]:
-            return [("main", True)]
-
     class FakeBranchOps:
         def __init__(self, runner) -> None:
             pass
@@ -52,12 +51,9 @@ def test_inspect_repo_can_skip_ahead_behind_for_lightweight_mode(monkeypatch) ->
         def get_remote_branches(self) -> set[str]:
             return {"main"}
 
-        def set_upstream(self, branch: str, *, auto_upstream: bool = False):
-            return True, "origin/main", None
-
-        def get_ahead_behind(self, branch: str, upstream: str):
-            calls["ahead_behind"] += 1
-            return (0, 0)
+        def get_branch_tracking(self, *, include_counts: bool = True):
+            calls.append(include_counts)
+            return [("main", True, "origin/main", (2, 1) if include_counts else None)]
 
     monkeypatch.setattr(
         "py_local_git_pull.core.services.inspector.GitRunner",
@@ -72,4 +68,44 @@ def test_inspect_repo_can_skip_ahead_behind_for_lightweight_mode(monkeypatch) ->
     inspection = RepoInspector().inspect_repo("/tmp/demo", include_branch_deltas=False)
 
     assert inspection.current_branch == "main"
-    assert calls["ahead_behind"] == 0
+    assert calls == [False]
+    assert inspection.branches[0].has_upstream is True
+    assert inspection.branches[0].ahead is None
+    assert inspection.branches[0].behind is None
+
+
+def test_inspect_repo_reads_current_branch_from_ref_listing(tmp_path, monkeypatch) -> None:
+    runner = GitRunner(str(tmp_path))
+    runner.run(["init", "-b", "main"])
+    runner.run(["config", "user.email", "test@test.com"])
+    runner.run(["config", "user.name", "Test"])
+
+    # Unborn branch: nothing in refs/heads yet, so git is asked directly.
+    assert RepoInspector().inspect_repo(str(tmp_path)).current_branch == "main"
+
+    runner.run(["commit", "--allow-empty", "-m", "init"])
+
+    def fail_get_current_branch(self) -> str | None:
+        raise AssertionError("current branch should come from for-each-ref")
+
+    monkeypatch.setattr(InfoOperations, "get_current_branch", fail_get_current_branch)
+
+    assert RepoInspector().inspect_repo(str(tmp_path)).current_branch == "main"
+
+
+def test_inspect_path_keeps_discovery_order_when_parallel(tmp_path) -> None:
+    for name in ("gamma", "alpha", "beta"):
+        repo = GitRunner(str(tmp_path / name))
+        (tmp_path / name).mkdir()
+        repo.run(["init", "-b", "main"])
+
+    inspections = RepoInspector().inspect_path(
+        str(tmp_path), recursive=True, max_depth=1, workers=3
+    )
+
+    assert [i.repo_name for i in inspections] == ["alpha", "beta", "gamma"]
+
+    selected = [str(tmp_path / name) for name in ("gamma", "alpha", "beta")]
+    inspections = RepoInspector().inspect_repos(selected, workers=3)
+
+    assert [i.repo_name for i in inspections] == ["gamma", "alpha", "beta"]
@@ -1,5 +1,15 @@
-from py_local_git_pull.core.models import RepoOutcome, RepoStatus
-from py_local_git_pull.runtime.executor import summarize_outcomes
+import threading
+
+import anyio
+
+from py_local_git_pull.core.models import (
+    PolicyMode,
+    RepoInspection,
+    RepoOutcome,
+    RepoStatus,
+    RiskLevel,
+)
+from py_local_git_pull.runtime.executor import execute_sync_run, summarize_outcomes
 
 
 def test_summarize_outcomes_counts_repo_statuses() -> None:
@@ -11,3 +21,60 @@ def test_summarize_outcomes_counts_repo_statuses() -> None:
     summary = summarize_outcomes(outcomes)
     assert summary.synced == 1
     assert summary.failed == 1
+
+
+def test_execute_sync_run_runs_more_than_default_thread_limit_concurrently() -> None:
+    workers = 45
+    barrier = threading.Barrier(workers, timeout=10)
+
+    class BlockingService:
+        def sync_repo(self, inspection, plan, options) -> RepoOutcome:
+            barrier.wait()
+            return RepoOutcome(
+                repo_name=inspection.repo_name,
+                path=inspection.path,
+                status=RepoStatus.SYNCED,
+                current_branch="main",
+                target_branches=("main",),
+                synced_branches=("main",),
+                skipped_branches=(),
+                stashed=False,
+            )
+
+    inspections = tuple(
+        RepoInspection(
+            repo_name=f"repo-{index:02d}",
+            path=f"/tmp/repo-{index:02d}",
+            current_branch="main",
+            is_git_repo=True,
+            is_bare=False,
+            has_changes=False,
+            has_untracked_changes=False,
+            detached_head=False,
+            branches=(),
+            risk_level=RiskLevel.LOW,
+            risk_flags=(),
+        )
+        for index in range(workers)
+    )
+
+    async def emit(event) -> None:
+        pass
+
+    async def run():
+        return await execute_sync_run(
+            path="/tmp",
+            inspections=inspections,
+            branches=(),
+            policy=PolicyMode.SAFE,
+            service_factory=lambda path: BlockingService(),
+            auto_upstream=False,
+            skip_non_exist=True,
+            no_stash=False,
+            depth=1,
+            workers=workers,
+            emit=emit,
+        )
+
+    record = anyio.run(run)
+    assert record.summary.synced == workers
@@ -1,7 +1,17 @@
+from dataclasses import asdict
+import json
 from pathlib import Path
 
-from py_local_git_pull.core.models import PolicyMode, RunRecord, RunSummary
-from py_local_git_pull.runtime.journal import load_last_run, write_run_record
+from py_local_git_pull.core.models import (
+    BranchOutcome,
+    BranchStatus,
+    PolicyMode,
+    RepoOutcome,
+    RepoStatus,
+    RunRecord,
+    RunSummary,
+)
+from py_local_git_pull.runtime.journal import json_default, load_last_run, write_run_record
 
 
 def test_write_and_load_last_run(tmp_path: Path) -> None:
@@ -23,3 +33,40 @@ def test_write_and_load_last_run(tmp_path: Path) -> None:
     assert loaded is not None
     assert loaded.run_id == "run-123"
     assert loaded.summary.synced == 1
+
+
+def test_json_default_matches_asdict_output() -> None:
+    outcome = RepoOutcome(
+        repo_name="demo",
+        path="/tmp/demo",
+        status=RepoStatus.SYNCED,
+        current_branch="main",
+        target_branches=("main",),
+        synced_branches=("main",),
+        skipped_branches=(),
+        stashed=False,
+        branch_outcomes=(
+            BranchOutcome(
+                name="main",
+                status=BranchStatus.SYNCED,
+                is_current=True,
+                has_upstream=True,
+                upstream_name="origin/main",
+                ahead=0,
+                behind=0,
+            ),
+        ),
+    )
+    run = RunRecord(
+        run_id="run-123",
+        command="sync",
+        path="/tmp/repos",
+        policy=PolicyMode.SAFE,
+        started_at="2026-04-01T10:00:00Z",
+        finished_at=None,
+        events=(),
+        outcomes=(outcome,),
+        summary=RunSummary(synced=1, partial=0, skipped=0, failed=0),
+    )
+
+    assert json.dumps(run, default=json_default) == json.dumps(asdict(run))
@@ -1,7 +1,7 @@
 import subprocess
 from pathlib import Path
 
-from py_local_git_pull.core.discovery.repo_finder import is_git_repo
+from py_local_git_pull.core.discovery.repo_finder import find_git_repos, is_git_repo
 
 
 def test_is_git_repo_should_only_match_repo_root(tmp_path: Path) -> None:
@@ -19,3 +19,93 @@ def test_is_git_repo_should_only_match_repo_root(tmp_path: Path) -> None:
 
     assert is_git_repo(str(repo_root)) is True
     assert is_git_repo(str(child)) is False
+
+
+def test_is_git_repo_detects_bare_repo_and_gitfile(tmp_path: Path) -> None:
+    bare = tmp_path / "bare.git"
+    subprocess.run(
+        ["git", "init", "--bare", str(bare)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    worktree = tmp_path / "worktree"
+    worktree.mkdir()
+    (bare / "worktrees" / "worktree").mkdir(parents=True)
+    (worktree / ".git").write_text(f"gitdir: {bare / 'worktrees' / 'worktree'}\n")
+
+    assert is_git_repo(str(bare)) is True
+    assert is_git_repo(str(worktree)) is True
+    assert is_git_repo(str(tmp_path)) is False
+
+
+def test_is_git_repo_rejects_stale_or_malformed_gitfile(tmp_path: Path) -> None:
+    stale = tmp_path / "stale"
+    stale.mkdir()
+    (stale / ".git").write_text("gitdir: /nonexistent/.git/worktrees/stale\n")
+    malformed = tmp_path / "malformed"
+    malformed.mkdir()
+    (malformed / ".git").write_text("not a gitfile\n")
+    relative = tmp_path / "relative"
+    (relative / "modules" / "sub").mkdir(parents=True)
+    (relative / ".git").write_text("gitdir: modules/sub\n")
+
+    assert is_git_repo(str(stale)) is False
+    assert is_git_repo(str(malformed)) is False
+    assert is_git_repo(str(relative)) is True
+
+
+def test_find_git_repos_walks_sibling_subtrees_up_to_max_depth(tmp_path: Path) -> None:
+    for relative in ("alpha", "group/beta", "group/nested/gamma", "a/b/c/d/too-deep"):
+        (tmp_path / relative / ".git").mkdir(parents=True)
+    (tmp_path / "node_modules" / "pkg" / ".git").mkdir(parents=True)
+
+    repos = find_git_repos(str(tmp_path), max_depth=2, workers=4)
+
+    assert repos == [
+        str((tmp_path / "alpha").resolve()),
+        str((tmp_path / "group/beta").resolve()),
+        str((tmp_path / "group/nested/gamma").resolve()),
+    ]
+
+
+def test_find_git_repos_does_not_descend_into_build_output(tmp_path: Path) -> None:
+    (tmp_path / "build" / "vendored" / ".git").mkdir(parents=True)
+    (tmp_path / "dist" / ".git").mkdir(parents=True)
+
+    repos = find_git_repos(str(tmp_path), max_depth=3, workers=2)
+
+    assert repos == [str((tmp_path / "dist").resolve())]
+
+    repos = find_git_repos(str(tmp_path), max_depth=3, workers=2, prune=False)
+
+    assert repos == [
+        str((tmp_path / "build" / "vendored").resolve()),
+        str((tmp_path / "dist").resolve()),
+    ]
+
+
+def test_is_git_repo_reads_core_bare_without_spawning_git(tmp_path: Path, monkeypatch) -> None:
+    bare = tmp_path / "bare.git"
+    subprocess.run(["git", "init", "--bare", str(bare)], check=True, capture_output=True)
+    gitdir = tmp_path / "repo"
+    subprocess.run(["git", "init", str(gitdir)], check=True, capture_output=True)
+
+    def fail_run(*args, **kwargs):
+        raise AssertionError("git should not be spawned")
+
+    monkeypatch.setattr(subprocess, "run", fail_run)
+
+    assert is_git_repo(str(bare)) is True
+    assert is_git_repo(str(gitdir / ".git")) is False
+
+
+def test_find_git_repos_returns_resolved_paths_through_symlinked_root(tmp_path: Path) -> None:
+    real_root = tmp_path / "real"
+    (real_root / "group" / "repo" / ".git").mkdir(parents=True)
+    link = tmp_path / "link"
+    link.symlink_to(real_root, target_is_directory=True)
+
+    repos = find_git_repos(str(link), max_depth=2, workers=2)
+
+    assert repos == [str((real_root / "group" / "repo").resolve())]